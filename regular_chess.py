@@ -6,31 +6,114 @@ import time
 import uuid
 import random
 import os
+import sys
+import argparse
+import copy
+import hashlib
+import json
+import pickle
+import string
+from functools import lru_cache, partial
 from os.path import join
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple, Any
 from dotenv import load_dotenv
 
+from chess import Move, PIECE_SYMBOLS, SQUARE_NAMES
 import textarena as ta
 from utils import Utils
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader
+
+
+# Pickled copies of parsed config files, so an unchanged config is never re-parsed
+CONFIG_CACHE_DIR = "./.cache"
+
+
+@lru_cache(maxsize=None)
+def _load_yaml_cached(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse one version of a YAML file, going through a pickle sidecar keyed by path, mtime and size"""
+    path_key = hashlib.sha1(os.path.abspath(config_path).encode()).hexdigest()[:16]
+    cache_path = join(CONFIG_CACHE_DIR, f"config.{path_key}.{mtime_ns}.{size}.pkl")
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if isinstance(cached, dict):
+            return cached
+    except Exception:
+        # Missing, truncated or foreign sidecar: parse the YAML instead
+        pass
+
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+
+    # The sidecar is only an optimization: write it atomically and ignore failures
+    try:
+        os.makedirs(CONFIG_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        # Keep one sidecar per config path: drop those for earlier versions of the file
+        prefix = f"config.{path_key}."
+        for entry in os.scandir(CONFIG_CACHE_DIR):
+            if entry.name.startswith(prefix) and entry.name.endswith(".pkl") and entry.path != cache_path:
+                os.remove(entry.path)
+    except OSError:
+        pass
+    return config
+
+
+def load_yaml_file(config_path: str) -> Dict[str, Any]:
+    """Parsed contents of a YAML file, cached for as long as the file is unchanged"""
+    stat = os.stat(config_path)
+    # Copy so callers can't mutate the cached document
+    return copy.deepcopy(_load_yaml_cached(config_path, stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=8)
+def compile_prompt(template: str) -> Callable[..., str]:
+    """
+    Parse a str.format template once into (literal, field, spec) parts and return a
+    function that only fills in the fields. Templates using conversions (!r), attribute
+    or index lookups, or nested specs fall back to template.format.
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if field is not None and (conversion or not field.isidentifier() or '{' in spec):
+            return template.format
+        parts.append((literal, field, spec))
+
+    def render(**fields: Any) -> str:
+        out = []
+        for literal, field, spec in parts:
+            out.append(literal)
+            if field is not None:
+                out.append(format(fields[field], spec))
+        return "".join(out)
+
+    return render
 
 
 class Config:
     """Configuration management with YAML support"""
     
     def __init__(self, config_path: Optional[str] = "./config.yml"):
-        if config_path and config_path.endswith('.yml'):
+        if config_path and (config_path == '-' or config_path.endswith(('.yml', '.yaml'))):
             self._load_from_yaml(config_path)
     
     def _load_from_yaml(self, config_path: str):
-        """Load configuration from YAML file"""
+        """Load configuration from YAML file, or from stdin when config_path is '-'"""
         try:
             # Load environment variables from .env file
             load_dotenv(dotenv_path='.env')
             
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-
+            if config_path == '-':
+                config = yaml.load(sys.stdin, Loader=SafeLoader)
+            else:
+                config = load_yaml_file(config_path)
             
             # API Configuration - load from environment variables only
             self.openai_api_key = os.getenv('OPENAI_API_KEY', '')
@@ -67,6 +150,12 @@ class GameLogger:
         self.base_path = base_path
         self.run_id = run_id
         self.log_path = join(base_path, str(run_id), "log.txt")
+        # One buffered handle for the whole game instead of an open/close per line
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        self._file = open(self.log_path, "a", encoding="utf-8", buffering=1 << 16)
+        # Step records are appended as JSON lines as the game goes, never rewritten
+        self.steps_path = join(base_path, str(run_id), "stepsinfo.jsonl")
+        self._steps_file = open(self.steps_path, "a", encoding="utf-8", buffering=1 << 16)
     
     def log(self, level: str, *args, save_log: bool = True) -> None:
         """Log message with specified level"""
@@ -74,7 +163,71 @@ class GameLogger:
         print(message, end='')
         
         if save_log:
-            Utils.append_file(message, self.log_path)
+            Utils.append_file(message, self.log_path, handle=self._file)
+
+    def log_many(self, level: str, *messages: str, save_log: bool = True) -> None:
+        """Log several messages at one level, formatted as separate log() calls would, with one print and one write"""
+        lines = [f"{level.upper()} {message}\n" for message in messages]
+        print("".join(lines), end='')
+        
+        if save_log:
+            Utils.append_file("\n".join(lines), self.log_path, handle=self._file)
+
+    def log_step(self, step: int, step_info: Dict[str, Any]) -> None:
+        """Append one step's record to stepsinfo.jsonl"""
+        self._steps_file.write(json.dumps({"step": step, **step_info}, separators=(",", ":")) + "\n")
+
+    def flush(self) -> None:
+        """Push buffered lines to disk, so a killed game still leaves a readable log"""
+        self._file.flush()
+        self._steps_file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+        self._steps_file.close()
+
+
+def _openai_agent(name: str, prompt: str, params: Dict[str, Any], api_key: str) -> Any:
+    # OpenAI accepts **kwargs that are passed to the API
+    return ta.agents.OpenAIAgent(
+        model_name=name,
+        system_prompt=prompt,
+        api_key=api_key,
+        base_url="https://api.openai.com/v1",
+        verbose=False,
+        **params
+    )
+
+
+def _openrouter_agent(name: str, prompt: str, params: Dict[str, Any], api_key: str) -> Any:
+    # OpenRouter accepts **kwargs that are passed to the API
+    return ta.agents.OpenRouterAgent(
+        model_name=name,
+        system_prompt=prompt,
+        api_key=api_key,
+        base_url="https://openrouter.ai/api/v1",
+        verbose=False,
+        **params
+    )
+
+
+def _gemini_agent(name: str, prompt: str, params: Dict[str, Any], api_key: str) -> Any:
+    # Gemini accepts generation_config as a dict parameter (not **kwargs)
+    return ta.agents.GeminiAgent(
+        model_name=name,
+        system_prompt=prompt,
+        api_key=api_key,
+        verbose=False,
+        generation_config=params if params else None
+    )
+
+
+# Agent constructor for each supported provider
+AGENT_BUILDERS = {
+    "OpenAI": _openai_agent,
+    "OpenRouter": _openrouter_agent,
+    "Gemini": _gemini_agent,
+}
 
 
 class AgentManager:
@@ -91,59 +244,28 @@ class AgentManager:
         self.black_player_prompt = black_player_prompt
         self.white_player_params = white_player_params or {}
         self.black_player_params = black_player_params or {}
+
+        # Everything each agent needs is bound here once; create_agents just calls these
+        self._build_white = self._agent_builder(self.white_player_provider, self.white_player_name, self.white_player_prompt, self.white_player_params)
+        self._build_black = self._agent_builder(self.black_player_provider, self.black_player_name, self.black_player_prompt, self.black_player_params)
+    
+    def _agent_builder(self, provider: str, name: str, prompt: str, params: Dict[str, Any]) -> Callable[[], Any]:
+        """Zero-argument constructor for one agent"""
+        builder = AGENT_BUILDERS.get(provider)
+        if builder is None:
+            def unknown_provider():
+                raise ValueError(f"Unknown provider: {provider}")
+            return unknown_provider
+
+        api_keys = {
+            "OpenAI": self.openai_api_key,
+            "OpenRouter": self.openrouter_api_key,
+            "Gemini": self.gemini_api_key,
+        }
+        return partial(builder, name, prompt, params, api_keys[provider])
     
     def create_agents(self) -> Dict[int, Any]:
-        agents = {}
-
-        agent_configs = [
-            {
-                "provider": self.white_player_provider,
-                "name": self.white_player_name,
-                "prompt": self.white_player_prompt,
-                "params": self.white_player_params
-            },
-            {
-                "provider": self.black_player_provider,
-                "name": self.black_player_name,
-                "prompt": self.black_player_prompt,
-                "params": self.black_player_params
-            }
-        ]
-
-        for i in range(2):
-            if agent_configs[i]["provider"] == "OpenAI":
-                # OpenAI accepts **kwargs that are passed to the API
-                agents[i] = ta.agents.OpenAIAgent(
-                    model_name=agent_configs[i]["name"],
-                    system_prompt=agent_configs[i]["prompt"],
-                    api_key=self.openai_api_key,
-                    base_url="https://api.openai.com/v1",
-                    verbose=False,
-                    **agent_configs[i]["params"]
-                )
-            elif agent_configs[i]["provider"] == "OpenRouter":
-                # OpenRouter accepts **kwargs that are passed to the API
-                agents[i] = ta.agents.OpenRouterAgent(
-                    model_name=agent_configs[i]["name"],
-                    system_prompt=agent_configs[i]["prompt"],
-                    api_key=self.openrouter_api_key,
-                    base_url="https://openrouter.ai/api/v1",
-                    verbose=False,
-                    **agent_configs[i]["params"]
-                )
-            elif agent_configs[i]["provider"] == "Gemini":
-                # Gemini accepts generation_config as a dict parameter (not **kwargs)
-                agents[i] = ta.agents.GeminiAgent(
-                    model_name=agent_configs[i]["name"],
-                    system_prompt=agent_configs[i]["prompt"],
-                    api_key=self.gemini_api_key,
-                    verbose=False,
-                    generation_config=agent_configs[i]["params"] if agent_configs[i]["params"] else None
-                )
-            else:
-                raise ValueError(f"Unknown provider: {agent_configs[i]['provider']}")
-
-        return agents
+        return {0: self._build_white(), 1: self._build_black()}
 
 
 class RegularChessRunner:
@@ -159,6 +281,10 @@ class RegularChessRunner:
         "the chess game, and you need to make a valid move from the last valid moves list. "
         "Return the move in the format [UCI_MOVE], for example [e2e4]."
     )
+    # Disabled for simplicity: retries resend the same prompt
+    APPEND_RETRY_PROMPT = False
+    # Pass each move to the chess env as a parsed chess.Move (ChessEnv.step_move) instead of a string
+    DIRECT_MOVE_STEP = True
     
     def __init__(
         self,
@@ -174,10 +300,11 @@ class RegularChessRunner:
         black_player_params: Optional[Dict[str, Any]] = None,
         max_turns: int = 100,
         config_path: Optional[str] = "./config.yml",
-        results_dir: Optional[str] = None
+        results_dir: Optional[str] = None,
+        config: Optional[Config] = None
     ):
-        """Initialize the chess runner with configuration"""
-        self.config = Config(config_path)
+        """Initialize the chess runner with configuration (an already loaded config takes precedence over config_path)"""
+        self.config = config if config is not None else Config(config_path)
 
         self.white_player_name = white_player_name
         self.black_player_name = black_player_name
@@ -210,6 +337,27 @@ class RegularChessRunner:
         # Initialize environment
         self.env = self._create_environment()
         print("Chess environment initialized successfully")
+
+        # Created on first use and kept for every game this runner plays
+        self._agents: Optional[Dict[int, Any]] = None
+    
+    def _get_agents(self) -> Dict[int, Any]:
+        """Agents keyed by player id (0=White, 1=Black), created once per runner"""
+        if self._agents is None:
+            self._agents = self.agent_manager.create_agents()
+        return self._agents
+    
+    def swap_colors(self) -> None:
+        """
+        Swap the White and Black players for the next run, reusing the environment and
+        the already created agents instead of building a new runner.
+        """
+        agents = self._get_agents()
+        self._agents = {0: agents[1], 1: agents[0]}
+        for field in ("name", "prompt", "step_wise_prompt", "provider", "params"):
+            white = getattr(self, f"white_player_{field}")
+            setattr(self, f"white_player_{field}", getattr(self, f"black_player_{field}"))
+            setattr(self, f"black_player_{field}", white)
     
     def _create_environment(self) -> ta.Env:
         env = ta.make(
@@ -220,9 +368,18 @@ class RegularChessRunner:
         )
         return env
     
-    def _get_valid_moves(self) -> List[str]:
-        """Get list of valid moves in UCI format"""
-        return [f'[{move.uci()}]' for move in self.env.state.game_state["board"].legal_moves]
+    def _get_valid_moves(self) -> Tuple[List[str], FrozenSet[str]]:
+        """
+        Get the valid moves in UCI format, as a list (in the order shown to the agent)
+        and as a frozenset for O(1) membership checks.
+        """
+        valid_moves = []
+        for move in self.env.state.game_state["board"].generate_legal_moves():
+            uci = SQUARE_NAMES[move.from_square] + SQUARE_NAMES[move.to_square]
+            if move.promotion:
+                uci += PIECE_SYMBOLS[move.promotion]
+            valid_moves.append(f'[{uci}]')
+        return valid_moves, frozenset(valid_moves)
     
     def _agent_call_with_retry(
         self, 
@@ -230,6 +387,7 @@ class RegularChessRunner:
         observation: str, 
         player_id: int, 
         valid_moves: List[str],
+        valid_move_set: FrozenSet[str],
         retries: int = 1
     ) -> Tuple[Optional[str], int, int, int, Dict]:
         """
@@ -247,21 +405,25 @@ class RegularChessRunner:
         last_input_tokens = 0
         last_output_tokens = 0
         last_total_tokens = 0
+        prompt = observation
+        last_prompt = prompt
+        cleaned_action = None
         
         for attempt in range(retries):
-            raw_action, input_tokens, output_tokens, total_tokens = agent(observation)
+            raw_action, input_tokens, output_tokens, total_tokens = agent(prompt)
             cleaned_action = Utils.clean_chess_action(raw_action)
             
             # Keep track of last attempt
+            last_prompt = prompt
             last_raw_action = raw_action
             last_input_tokens = input_tokens
             last_output_tokens = output_tokens
             last_total_tokens = total_tokens
             
-            if cleaned_action and cleaned_action in valid_moves:
+            if cleaned_action and cleaned_action in valid_move_set:
                 # Success - return info about this successful attempt
                 attempt_info = {
-                    "prompt_input": observation,
+                    "prompt_input": prompt,
                     "llm_raw_output": raw_action,
                     "cleaned_action": cleaned_action,
                     "input_tokens": input_tokens,
@@ -271,17 +433,15 @@ class RegularChessRunner:
                 }
                 return cleaned_action, input_tokens, output_tokens, total_tokens, attempt_info
             
-            # observation += self.RETRY_PROMPT.format(
-            #     attempt=attempt + 1, 
-            #     role=role
-            # ) # disable the attempt prompt for simplicity
+            if self.APPEND_RETRY_PROMPT:
+                prompt += self.RETRY_PROMPT.format(attempt=attempt + 1, role=role)
         
         # If we get here, all retries failed - use random fallback
         random_move = random.choice(valid_moves)
 
         # Return info about the failed attempt with random fallback
         attempt_info = {
-            "prompt_input": observation,
+            "prompt_input": last_prompt,
             "llm_raw_output": last_raw_action,
             "cleaned_action": random_move,
             "input_tokens": last_input_tokens,
@@ -293,9 +453,19 @@ class RegularChessRunner:
         
         return random_move, 0, 0, 0, attempt_info
     
-    def _current_agent_task(self, agent: Any, observation: str, player_id: int) -> Tuple[Optional[str], float, int, int, int, Dict]:
+    def _current_agent_task(
+        self,
+        agent: Any,
+        observation: str,
+        player_id: int,
+        board_with_coords: Optional[str] = None,
+        piece_positions: Optional[str] = None
+    ) -> Tuple[Optional[str], float, int, int, int, Dict]:
         """
         Execute the current agent's move selection.
+
+        board_with_coords and piece_positions may be passed in when the caller has
+        already rendered the current board; otherwise they are computed here.
         
         Returns:
             move: The selected move
@@ -306,17 +476,21 @@ class RegularChessRunner:
             attempt_info: Dict with info about the final attempt
         """
         start_time = time.perf_counter()
-        valid_moves = self._get_valid_moves()
+        # The list keeps the order shown in the prompt; the set makes checking replies O(1)
+        valid_moves, valid_move_set = self._get_valid_moves()
 
         role = "White" if player_id == 0 else "Black"
-        board_with_coords = Utils.board_with_coords(self.env.state.game_state['board'])
-        piece_positions = Utils.list_piece_positions(self.env.state.game_state['board'])
+        if board_with_coords is None:
+            board_with_coords = Utils.board_with_coords(self.env.state.game_state['board'])
+        if piece_positions is None:
+            piece_positions = Utils.list_piece_positions(self.env.state.game_state['board'])
 
         # Use the appropriate step_wise_prompt based on player_id (0=White, 1=Black)
         prompt_template = self.white_player_step_wise_prompt if player_id == 0 else self.black_player_step_wise_prompt
+        render_prompt = compile_prompt(prompt_template)
         truncated_observation, truncated_moves_list = Utils.truncate_observation(observation, 5)
 
-        passed_observation = prompt_template.format(
+        passed_observation = render_prompt(
             role=role,
             board=board_with_coords,
             piece_positions=piece_positions,
@@ -325,7 +499,7 @@ class RegularChessRunner:
             past_up_to_five_moves=truncated_moves_list
         )
 
-        move, input_tokens, output_tokens, total_tokens, attempt_info = self._agent_call_with_retry(agent, passed_observation, player_id, valid_moves)
+        move, input_tokens, output_tokens, total_tokens, attempt_info = self._agent_call_with_retry(agent, passed_observation, player_id, valid_moves, valid_move_set)
         end_time = time.perf_counter()
         
         return move, end_time - start_time, input_tokens, output_tokens, total_tokens, attempt_info
@@ -342,57 +516,72 @@ class RegularChessRunner:
         step_count = 0
         done = False
 
-        current_agent = agents[0]
-        other_agent = agents[1]
-        
         regular_time = 0.0
+        board_str = None  # Rendering of the current position, carried between plies
 
-
-        # Initialize game state
-        player_id, observation = self.env.get_observation()
-        
         while not done:
 
             player_id, observation = self.env.get_observation()
 
 
-            current_future = self._current_agent_task(current_agent, observation, player_id)
-                    
-            current_move, time_taken1, input_tokens1, output_tokens1, total_tokens1, attempt_info = current_future
-                
-            # Update timing counters
-            regular_time += time_taken1
-            
+            # Render the board once per ply for the prompt, steps_info and the log. The
+            # position is unchanged since the last ply's AFTER MOVE render, so reuse that
+            board = self.env.state.game_state['board']
+            if board_str is None:
+                board_str = Utils.board_with_coords(board)
+            pieces_str = Utils.list_piece_positions(board)
+
             # Capture board state BEFORE move for steps_info (what the agent saw)
-            board_before_move = "\n" + Utils.board_with_coords(self.env.state.game_state['board']) + '\n'
+            board_before_move = "\n" + board_str + '\n'
             
             # Enhanced logging for log.txt (before move execution)
+            # Flushed before the (slow) agent call, so log.txt shows this ply's
+            # header and board while the agent thinks
             if self.logger:
                 role = "White" if player_id == 0 else "Black"
-                self.logger.log("INFO", f"{'='*100}")
-                self.logger.log("INFO", f"STEP {step_count} | Player: {role} (ID: {player_id})")
-                self.logger.log("INFO", f"{'='*100}")
-                
-                # Log board state BEFORE move
-                self.logger.log("INFO", f"\nBOARD STATE BEFORE MOVE:")
-                self.logger.log("INFO", Utils.board_with_coords(self.env.state.game_state['board']))
+                self.logger.log_many(
+                    "INFO",
+                    f"{'='*100}",
+                    f"STEP {step_count} | Player: {role} (ID: {player_id})",
+                    f"{'='*100}",
+                    # Board state BEFORE move
+                    f"\nBOARD STATE BEFORE MOVE:",
+                    board_str
+                )
+                self.logger.flush()
+            
+            current_move, time_taken1, input_tokens1, output_tokens1, total_tokens1, attempt_info = self._current_agent_task(
+                agents[player_id], observation, player_id, board_str, pieces_str
+            )
                 
+            # Update timing counters
+            regular_time += time_taken1
+            
+            if self.logger:
                 # Log the final attempt
-                self.logger.log("INFO", f"\nPROMPT INPUT:\n{attempt_info['prompt_input']}")
-                self.logger.log("INFO", f"\nLLM RAW OUTPUT:\n{attempt_info['llm_raw_output']}")
-                self.logger.log("INFO", f"\nCLEANED ACTION: {attempt_info['cleaned_action']}")
+                messages = [
+                    f"\nPROMPT INPUT:\n{attempt_info['prompt_input']}",
+                    f"\nLLM RAW OUTPUT:\n{attempt_info['llm_raw_output']}",
+                    f"\nCLEANED ACTION: {attempt_info['cleaned_action']}"
+                ]
                 
                 # Add failure note if it was a random fallback
                 if attempt_info.get('is_random_fallback'):
-                    self.logger.log("INFO", f"\n⚠️  NOTE: {attempt_info['failure_reason']}")
-                    self.logger.log("INFO", f"Random fallback move selected: {attempt_info['cleaned_action']}")
+                    messages.append(f"\n⚠️  NOTE: {attempt_info['failure_reason']}")
+                    messages.append(f"Random fallback move selected: {attempt_info['cleaned_action']}")
                 
-                self.logger.log("INFO", f"\nTOKENS - Input: {attempt_info['input_tokens']}, Output: {attempt_info['output_tokens']}, Total: {attempt_info['total_tokens']}")
-                self.logger.log("INFO", f"\nFINAL MOVE: {current_move}")
-                self.logger.log("INFO", f"TIME TAKEN: {time_taken1:.3f}s")
+                messages.append(f"\nTOKENS - Input: {attempt_info['input_tokens']}, Output: {attempt_info['output_tokens']}, Total: {attempt_info['total_tokens']}")
+                messages.append(f"\nFINAL MOVE: {current_move}")
+                messages.append(f"TIME TAKEN: {time_taken1:.3f}s")
+                self.logger.log_many("INFO", *messages)
             
             # Execute move
-            done, info = self.env.step(current_move)
+            if self.DIRECT_MOVE_STEP:
+                # current_move is always a bracketed legal move, so hand the env the parsed
+                # move rather than a string for it to re-format and re-parse
+                done, info = self.env.step_move(Move.from_uci(current_move[1:-1]))
+            else:
+                done, info = self.env.step(current_move)
             
             # Record step information (including full prompt and output)
             # Note: current_observation is the board BEFORE the move (what the agent saw)
@@ -406,25 +595,25 @@ class RegularChessRunner:
                 "total_tokens_current_agent": total_tokens1,
                 "attempt_info": attempt_info  # Info about the final attempt
             }
+            if self.logger:
+                self.logger.log_step(step_count, steps_info[step_count])
             
+            board_str = Utils.board_with_coords(board)
+
             # Log board state AFTER move execution
             if self.logger:
-                self.logger.log("INFO", f"\nBOARD STATE AFTER MOVE:")
-                self.logger.log("INFO", Utils.board_with_coords(self.env.state.game_state['board']))
+                self.logger.log_many("INFO", f"\nBOARD STATE AFTER MOVE:", board_str)
                 self.logger.log('-' * 100)
             step_count += 1
             
             if stop_after and step_count >= stop_after:
                 break
-            
-            # Swap agents for next turn
-            current_agent, other_agent = other_agent, current_agent
         
         rewards, game_info = self.env.close()
         return steps_info, rewards, game_info, regular_time
     
-    def run(self, stop_after: int = 100, match_id: str = None, game_label: str = None) -> None:
-        """Run a complete chess game"""
+    def run(self, stop_after: int = 100, match_id: str = None, game_label: str = None) -> str:
+        """Run a complete chess game and return the directory holding its results"""
         # Setup run
         if match_id is None:
             match_id = str(uuid.uuid4())
@@ -437,9 +626,11 @@ class RegularChessRunner:
         self.logger = GameLogger(match_dir, game_label)
 
         current_dir_path = join(match_dir, game_label)
+        # Announced up front so test drivers know where the log is even if the game is killed
+        print(f"Results dir: {current_dir_path}", flush=True)
         
-        # Create agents
-        agents = self.agent_manager.create_agents()
+        # Create agents (only on the first run; later runs reuse them)
+        agents = self._get_agents()
         
         self.logger.log("INFO", f"Starting run with White Player: {self.white_player_name} with prompt \n{self.white_player_prompt} \nBlack Player: {self.black_player_name} with prompt \n{self.black_player_prompt}")
         
@@ -450,21 +641,31 @@ class RegularChessRunner:
             )
             
             # Save results
-            Utils.save_json(steps_info, join(current_dir_path, "stepsinfo.json"))
+            # steps_info was already written step by step to stepsinfo.jsonl
             Utils.save_json(rewards, join(current_dir_path, "rewards.json"))
             Utils.save_json(game_info, join(current_dir_path, "game_info.json"))
             
             self.logger.log("INFO", f"Run completed for match {match_id} and game {game_label}")
+            return current_dir_path
             
         except Exception as e:
             if self.logger:
                 self.logger.log("ERROR", str(e))
             raise
+        finally:
+            self.logger.close()
 
 
 def main():
     """Main execution function"""
-    config_path = "./config.yml"
+    parser = argparse.ArgumentParser(description="Run a regular chess game")
+    parser.add_argument("--config", default="./config.yml", help="Path to the YAML config file, or '-' to read it from stdin")
+    parser.add_argument("--both-colors", action="store_true", help="Also play the return game with Agent1 as White")
+    args = parser.parse_args()
+
+    config_path = args.config
+    if config_path != '-' and not config_path.endswith(('.yml', '.yaml')):
+        parser.error(f"--config must be a .yml/.yaml file or '-', got {config_path!r}")
     config = Config(config_path)
 
     # Generate a unique match ID for this pair of games
@@ -502,17 +703,29 @@ def main():
         black_player_prompt=agent1_system_prompt,
         black_player_step_wise_prompt=agent1_step_wise_prompt,
         max_turns=config.stop_after,
-        results_dir=results_dir
+        results_dir=results_dir,
+        config=config
     )
 
     start_time = time.time()
     print("Game: Agent0 as White, Agent1 as Black")
-    runner_agent0_as_white.run(stop_after=config.stop_after, match_id=match_id, game_label="white_player_agent0")
+    game_dir = runner_agent0_as_white.run(stop_after=config.stop_after, match_id=match_id, game_label="white_player_agent0")
     game_time = time.time() - start_time
 
-    print(f"Match {match_id} completed!")
     print(f"Game time: {game_time:.2f} seconds")
-    print(f"Results saved in: ./Results/{match_id}/")
+    print(f"Results saved to: {game_dir}")
+
+    if args.both_colors:
+        # Same runner, environment and agents; only the colors change
+        runner_agent0_as_white.swap_colors()
+        start_time = time.time()
+        print("Game: Agent1 as White, Agent0 as Black")
+        game_dir = runner_agent0_as_white.run(stop_after=config.stop_after, match_id=match_id, game_label="white_player_agent1")
+        game_time = time.time() - start_time
+        print(f"Game time: {game_time:.2f} seconds")
+        print(f"Results saved to: {game_dir}")
+
+    print(f"Match {match_id} completed!")
 
 
 if __name__ == "__main__":
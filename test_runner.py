@@ -0,0 +1,754 @@
+#!/usr/bin/env python3
+"""
+Chess Model Testing
+Plays one game per model configuration and ranks the models.
+
+Usage:
+    python test_runner.py --configs quick           # Top 3 models, 50-step games
+    python test_runner.py --configs comprehensive   # All approved models, 100-step games
+"""
+
+import argparse
+import asyncio
+import json
+import mmap
+import os
+import re
+import signal
+import subprocess
+import urllib.request
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from types import MappingProxyType
+import time
+import yaml
+from dotenv import load_dotenv
+
+try:
+    from yaml import CSafeDumper as SafeDumper  # libyaml C emitter
+except ImportError:
+    from yaml import SafeDumper
+
+try:
+    import orjson  # Optional: faster serialization of per-game result lines
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: lets us stop parsing game_info.json once "winner" is read
+except ImportError:
+    ijson = None
+
+# Maximum number of games running at once (keeps us under provider rate limits)
+MAX_CONCURRENT_TESTS = 3
+
+# regular_chess.py prints the directory holding the game's results as soon as the game starts
+RESULTS_DIR_PATTERN = re.compile(r"^Results dir: (.+?)\r?$")
+
+# Log lines counted per game, keyed by the result field they feed. Every marker is
+# found in one pass over log.txt; add new ones here rather than scanning again
+LOG_MARKERS = {
+    "invalid_moves": rb"Random fallback",
+    "errors": rb"^ERROR ",
+}
+LOG_MARKER_PATTERN = re.compile(
+    b"|".join(b"(?P<%s>%s)" % (name.encode(), marker) for name, marker in LOG_MARKERS.items()),
+    re.MULTILINE
+)
+
+# Longest stdout line we buffer while streaming a game's output (LLM replies can be long)
+STDOUT_LINE_LIMIT = 1 << 20
+
+# Run each game in its own process group so a timeout can kill the whole tree
+SPAWN_KWARGS = {"start_new_session": True} if os.name == "posix" else {}
+
+# Provider model listings used to reject misspelled model names before any game starts
+MODEL_LIST_URLS = {
+    "OpenRouter": "https://openrouter.ai/api/v1/models",
+    "OpenAI": "https://api.openai.com/v1/models",
+}
+MODEL_LIST_API_KEYS = {
+    "OpenRouter": "OPENROUTER_API_KEY",
+    "OpenAI": "OPENAI_API_KEY",
+}
+MODELS_CACHE_FILE = Path.home() / ".cache" / "chess_models.json"
+MODELS_CACHE_TTL = 24 * 60 * 60  # seconds
+MODELS_FAILURE_TTL = 60 * 60  # seconds before a provider whose listing failed is asked again
+
+# Top priority models based on analysis
+CONFIGS_QUICK = [
+    {
+        "name": "GPT-4o-mini",
+        "provider": "OpenAI",
+        "model": "gpt-4o-mini",
+        "temperature": 0.6,
+        "reason": "Proven performer in initial tests"
+    },
+    {
+        "name": "DeepSeek-R1",
+        "provider": "OpenRouter",
+        "model": "deepseek/deepseek-r1-0528",
+        "temperature": 0.6,
+        "reason": "Reasoning model, best for strategy"
+    },
+    {
+        "name": "DeepSeek-Chat-v3.1",
+        "provider": "OpenRouter",
+        "model": "deepseek/deepseek-chat-v3.1",
+        "temperature": 0.7,
+        "reason": "Fast and strong general model"
+    },
+]
+
+# Test configurations for all approved models, sorted by priority once at import
+CONFIGS_FULL = sorted([
+    {
+        "name": "DeepSeek-R1-0528",
+        "provider": "OpenRouter",
+        "model": "deepseek/deepseek-r1-0528",
+        "temperature": 0.6,
+        "priority": 1  # High priority - reasoning model
+    },
+    {
+        "name": "DeepSeek-Chat-v3.1",
+        "provider": "OpenRouter",
+        "model": "deepseek/deepseek-chat-v3.1",
+        "temperature": 0.7,
+        "priority": 2
+    },
+    {
+        "name": "GPT-4o-mini",
+        "provider": "OpenAI",
+        "model": "gpt-4o-mini",
+        "temperature": 0.6,
+        "priority": 1  # High priority - proven performer
+    },
+    {
+        "name": "Gemini-2.5-Flash-Preview",
+        "provider": "OpenRouter",
+        "model": "google/gemini-2.5-flash-preview-09-2025",
+        "temperature": 0.7,
+        "priority": 2
+    },
+    {
+        "name": "Gemini-2.5-Flash",
+        "provider": "OpenRouter",
+        "model": "google/gemini-2.5-flash",
+        "temperature": 0.7,
+        "priority": 3
+    },
+    {
+        "name": "Qwen3-235b",
+        "provider": "OpenRouter",
+        "model": "qwen/qwen3-235b-a22b-2507",
+        "temperature": 0.7,
+        "priority": 3
+    },
+    {
+        "name": "Grok-4-Fast",
+        "provider": "OpenRouter",
+        "model": "x-ai/grok-4-fast",
+        "temperature": 0.7,
+        "priority": 3
+    },
+], key=itemgetter("priority"))
+
+# Prompts for the quick suite (compact)
+QUICK_PROMPTS = {
+    "system_prompt": """You are an expert chess player. Your goal: win by making strategic, legal moves.
+
+CRITICAL RULES:
+1. Output format: [e2e4] (UCI in square brackets)
+2. Choose ONLY from the valid moves list
+3. Control center, develop pieces, protect king
+4. Think ahead: consider opponent responses
+
+Always end with your move in [UCI] format.""",
+
+    "step_wise_prompt": """🎯 CHESS POSITION
+
+Role: {role}
+
+BOARD:
+{board}
+
+PIECES:
+{piece_positions}
+
+LEGAL MOVES:
+{valid_moves}
+
+HISTORY:
+{past_up_to_five_moves}
+
+ANALYSIS:
+1. Threats? 2. Opportunities? 3. King safe? 4. Best move from legal list?
+
+REMEMBER: lowercase=Black, UPPERCASE=White
+
+[Your reasoning]
+Final: [move]"""
+}
+
+# Prompts for the comprehensive suite (step-by-step analysis)
+FULL_PROMPTS = {
+    "system_prompt": """You are an expert chess player competing in a tournament. Your goal is to win by making strategic, legal moves.
+
+Key principles:
+1. Always output moves in UCI format within square brackets: [e2e4]
+2. Control the center (e4, d4, e5, d5)
+3. Develop pieces early (knights before bishops)
+4. Protect your king (consider castling)
+5. Think ahead: consider opponent's responses
+6. Only make moves from the valid moves list provided
+
+Format: Always end with your move in [UCI] format on the last line.""",
+
+    "step_wise_prompt": """[CHESS GAME - Move Analysis]
+
+You are playing as {role}.
+
+=== CURRENT BOARD ===
+{board}
+
+=== PIECE POSITIONS ===
+{piece_positions}
+
+=== YOUR LEGAL MOVES ===
+{valid_moves}
+
+=== RECENT GAME HISTORY ===
+{past_up_to_five_moves}
+
+=== YOUR TASK ===
+Analyze the position step-by-step:
+
+1. ASSESS THREATS: What is my opponent threatening?
+2. IDENTIFY OPPORTUNITIES: Can I capture pieces, control center, or improve position?
+3. CONSIDER STRATEGY: Am I developing pieces? Is my king safe?
+4. EVALUATE OPTIONS: Compare 2-3 best moves from the legal moves list
+5. CHOOSE MOVE: Select the best move
+
+IMPORTANT:
+- You MUST choose from the legal moves list above
+- Small letters (p, n, b, r, q, k) = Black pieces
+- Capital letters (P, N, B, R, Q, K) = White pieces
+
+Output format:
+[Your reasoning]
+
+Final move: [UCI_move_in_brackets]"""
+}
+
+# Opponent (agent1) prompts
+QUICK_OPPONENT_PROMPTS = {
+    "system_prompt": "You are a chess player. Make legal moves.",
+    "step_wise_prompt": "Role: {role}\nBoard: {board}\nMoves: {valid_moves}\nHistory: {past_up_to_five_moves}\n\nYour move: [move]"
+}
+
+FULL_OPPONENT_PROMPTS = {
+    "system_prompt": "You are a competitive chess player. Make smart, legal moves.",
+    "step_wise_prompt": """Playing as {role}
+
+Board: {board}
+Legal moves: {valid_moves}
+History: {past_up_to_five_moves}
+
+Choose your best move from the legal moves list. Format: [move]"""
+}
+
+# Everything that differs between the quick and comprehensive runs
+SUITES = {
+    "quick": {
+        "title": "⚡ QUICK MODEL TESTING - Top 3 Models",
+        "configs": CONFIGS_QUICK,
+        "prompts": QUICK_PROMPTS,
+        "opponent_prompts": QUICK_OPPONENT_PROMPTS,
+        "stop_after": 50,  # Shorter for quick test
+        "timeout": 300,
+        "provider_cooldown": 3,  # Minimum seconds between game starts on the same provider
+        "results_file": "quick_test_results.jsonl",
+        "report_game_info": False,
+        "write_best_config": True,  # Write a full 100-step config.yml for the winner
+    },
+    "comprehensive": {
+        "title": "🏆 Comprehensive Chess Model Testing",
+        "configs": CONFIGS_FULL,
+        "prompts": FULL_PROMPTS,
+        "opponent_prompts": FULL_OPPONENT_PROMPTS,
+        "stop_after": 100,
+        "timeout": 600,
+        "provider_cooldown": 5,
+        "results_file": "test_results.jsonl",
+        "report_game_info": True,
+        "write_best_config": False,
+    },
+}
+
+# Fixed opponent every tested model plays against; read-only since all configs share it
+OPPONENT_MODEL = MappingProxyType({
+    "provider": "OpenRouter",
+    "name": "deepseek/deepseek-chat-v3.1",
+    "params": MappingProxyType({
+        "temperature": 0.7
+    })
+})
+
+# Game length of the config written for submission
+SUBMISSION_STOP_AFTER = 100
+
+
+def build_config(provider, model, temperature, prompts, opponent_prompts, stop_after):
+    """Build the config dict for testing a specific model"""
+    return {
+        "game": {
+            "num_players": 2,
+            "stop_after": stop_after
+        },
+        "agent0": {
+            "model": {
+                "provider": provider,
+                "name": model,
+                "params": {
+                    "temperature": temperature
+                }
+            },
+            "prompts": prompts
+        },
+        "agent1": {
+            # Plain-dict copies: the YAML dumper has no representer for mapping proxies
+            "model": {**OPPONENT_MODEL, "params": dict(OPPONENT_MODEL["params"])},
+            "prompts": opponent_prompts
+        }
+    }
+
+
+@lru_cache(maxsize=None)
+def config_template(suite_name, stop_after):
+    """YAML for a suite with provider/model/temperature placeholders, dumped once per layout"""
+    suite = SUITES[suite_name]
+    return yaml.dump(
+        build_config(
+            "__PROVIDER__", "__MODEL__", "__TEMPERATURE__",
+            suite["prompts"], suite["opponent_prompts"], stop_after
+        ),
+        Dumper=SafeDumper,
+        default_flow_style=False,
+        sort_keys=False
+    )
+
+
+@lru_cache(maxsize=32)
+def render_config(template, provider, model, temperature):
+    """Fill the model-specific placeholders of a pre-rendered config template
+
+    Memoized on scalar arguments so retries and repeated writes of the same
+    model reuse the rendered string.
+    """
+    # JSON scalars are valid YAML flow scalars, so this quotes/escapes safely
+    return (
+        template
+        .replace("__PROVIDER__", json.dumps(provider))
+        .replace("__MODEL__", json.dumps(model))
+        .replace("__TEMPERATURE__", json.dumps(temperature))
+    )
+
+
+def config_text(test_config, suite_name, stop_after=None):
+    """Render the config YAML for a specific model; stop_after defaults to the suite's game length"""
+    if stop_after is None:
+        stop_after = SUITES[suite_name]["stop_after"]
+    return render_config(
+        config_template(suite_name, stop_after),
+        test_config["provider"],
+        test_config["model"],
+        test_config["temperature"]
+    )
+
+
+def create_config(test_config, suite_name, output_file="config.yml", stop_after=None):
+    """Create a config.yml for a specific model"""
+    Path(output_file).write_text(config_text(test_config, suite_name, stop_after))
+
+    return output_file
+
+
+def read_json_key(f, key, default=None):
+    """Read a single top-level key from a JSON file opened in binary mode"""
+    if ijson is not None:
+        return next(ijson.items(f, key), default)
+    return json.load(f).get(key, default)
+
+
+def count_markers(path):
+    """Count every LOG_MARKERS entry in a file in a single pass, without reading it into memory"""
+    counts = Counter(dict.fromkeys(LOG_MARKERS, 0))
+    with open(path, "rb") as f:
+        # mmap refuses to map empty files
+        if os.fstat(f.fileno()).st_size == 0:
+            return counts
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            counts.update(match.lastgroup for match in LOG_MARKER_PATTERN.finditer(mm))
+    return counts
+
+
+def fetch_model_ids(provider):
+    """Fetch the ids of all models a provider currently serves"""
+    request = urllib.request.Request(MODEL_LIST_URLS[provider])
+    api_key = os.getenv(MODEL_LIST_API_KEYS[provider])
+    if api_key:
+        request.add_header("Authorization", f"Bearer {api_key}")
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return sorted(model["id"] for model in json.load(response)["data"])
+
+
+def load_known_models(providers):
+    """Map provider -> set of model ids, cached on disk for MODELS_CACHE_TTL
+
+    Providers whose model list can't be fetched are left out, so their
+    configs are not validated rather than wrongly rejected. The failure is
+    cached for MODELS_FAILURE_TTL so every run doesn't retry and warn again.
+    """
+    try:
+        cache = json.loads(MODELS_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+
+    now = time.time()
+    updated = False
+    known = {}
+    for provider in providers:
+        try:
+            ids = cache[provider]["ids"]
+            ttl = MODELS_CACHE_TTL if ids is not None else MODELS_FAILURE_TTL
+            ids = ids if ids is None else set(ids)
+            stale = now - cache[provider]["fetched_at"] > ttl
+        except (KeyError, TypeError):  # Not cached yet, or a malformed entry
+            stale = True
+        if stale:
+            if provider not in MODEL_LIST_URLS:
+                continue
+            try:
+                ids = fetch_model_ids(provider)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"⚠️  Could not list {provider} models, skipping validation: {e}")
+                ids = None
+            cache[provider] = {"fetched_at": now, "ids": ids}
+            updated = True
+        if ids is not None:
+            known[provider] = set(ids)
+
+    if updated:
+        try:
+            MODELS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            MODELS_CACHE_FILE.write_text(json.dumps(cache))
+        except OSError:
+            pass
+
+    return known
+
+
+def validate_configs(configs):
+    """Split configs into (runnable, rejected) by checking model names against the provider"""
+    known = load_known_models({config["provider"] for config in configs})
+    runnable, rejected = [], []
+    for config in configs:
+        models = known.get(config["provider"])
+        if models is not None and config["model"] not in models:
+            rejected.append(config)
+        else:
+            runnable.append(config)
+    return runnable, rejected
+
+
+class Deadline:
+    """Time budget shared by every wait within one game, so nested waits can't reset the clock"""
+
+    def __init__(self, timeout):
+        self.expires_at = time.monotonic() + timeout
+
+    @property
+    def remaining(self):
+        """Seconds left before the deadline, never negative"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+
+async def kill_process_tree(proc):
+    """Kill a game and its children; `uv run` spawns a grandchild Python that proc.kill() misses"""
+    try:
+        if os.name == "posix":
+            # The game was started in its own session, so its pid is also its process group id
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)], capture_output=True)
+    except ProcessLookupError:
+        pass
+    await proc.wait()
+
+
+async def watch_output(proc, game_dir):
+    """Stream a game's stdout until it exits, resolving game_dir once the run reports it"""
+    async for line in proc.stdout:
+        if not game_dir.done():
+            match = RESULTS_DIR_PATTERN.match(line.decode(errors="replace"))
+            if match:
+                game_dir.set_result(Path(match.group(1)))
+    await proc.wait()
+
+
+def parse_result(test_config, game_dir, elapsed_time, report_game_info):
+    """Collect the outcome of a finished game from its results directory"""
+    # One directory read instead of a stat per probed file
+    entries = {entry.name: entry for entry in os.scandir(game_dir)}
+    log_file = game_dir / "log.txt"
+
+    # Read game info
+    game_info = {}
+    winner = "Unknown"
+    game_info_entry = entries.get("game_info.json")
+    if game_info_entry and game_info_entry.is_file():
+        with open(game_info_entry.path, "rb") as f:
+            if report_game_info:
+                game_info = json.load(f)
+                winner = game_info.get("winner", winner)
+            else:
+                winner = read_json_key(f, "winner", winner)
+
+    # Check for invalid moves and logged errors
+    markers = Counter(dict.fromkeys(LOG_MARKERS, 0))
+    log_entry = entries.get("log.txt")
+    if log_entry and log_entry.is_file():
+        markers = count_markers(log_entry.path)
+
+    return {
+        "name": test_config["name"],
+        "model": test_config["model"],
+        "provider": test_config["provider"],
+        "success": True,
+        "time": elapsed_time,
+        "game_info": game_info,
+        "winner": winner,
+        **markers,
+        "log_path": str(log_file)
+    }
+
+
+def failed_result(test_config, error, elapsed_time, game_dir=None):
+    result = {
+        "name": test_config["name"],
+        "model": test_config["model"],
+        "provider": test_config["provider"],
+        "success": False,
+        "error": error,
+        "time": elapsed_time
+    }
+    # A game that started but did not finish still leaves a partial log worth reading
+    if game_dir is not None:
+        result["log_path"] = str(game_dir / "log.txt")
+    return result
+
+
+async def run_test(test_config, suite_name):
+    """Run a single test game"""
+    suite = SUITES[suite_name]
+    print(f"\n{'='*80}")
+    print(f"🎮 Testing: {test_config['name']}")
+    print(f"   Model: {test_config['model']}")
+    print(f"   Provider: {test_config['provider']}")
+    print(f"   Temperature: {test_config['temperature']}")
+    if "reason" in test_config:
+        print(f"   Reason: {test_config['reason']}")
+    print(f"{'='*80}\n")
+
+    # Run game
+    start_time = time.time()
+    deadline = Deadline(suite["timeout"])
+    proc = None
+    # Resolved from the game's own output, so concurrent games never have to search Results/
+    game_dir = asyncio.get_running_loop().create_future()
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "uv", "run", "regular_chess.py", "--config", "-",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=STDOUT_LINE_LIMIT,
+            **SPAWN_KWARGS
+        )
+        # Pipe the config in: no file on disk and nothing shared between concurrent games
+        proc.stdin.write(config_text(test_config, suite_name).encode())
+        await proc.stdin.drain()
+        proc.stdin.close()
+
+        await asyncio.wait_for(watch_output(proc, game_dir), timeout=deadline.remaining)
+        elapsed_time = time.time() - start_time
+
+        if not game_dir.done():
+            return failed_result(test_config, "No results found", elapsed_time)
+        if proc.returncode != 0:
+            return failed_result(test_config, f"Game exited with code {proc.returncode}", elapsed_time, game_dir.result())
+
+        # Parse results from the game directory reported by the run. The directory scan and
+        # log/JSON reads run in a worker thread so they don't stall the other games' streams
+        return await asyncio.to_thread(
+            parse_result, test_config, game_dir.result(), elapsed_time, suite["report_game_info"]
+        )
+
+    except asyncio.TimeoutError:
+        return failed_result(test_config, f"Timeout (>{suite['timeout'] // 60} minutes)", suite["timeout"],
+                             game_dir.result() if game_dir.done() else None)
+    except Exception as e:
+        return failed_result(test_config, str(e), time.time() - start_time)
+    finally:
+        # Covers timeouts and cancellation: never leave a game running
+        if proc is not None and proc.returncode is None:
+            await kill_process_tree(proc)
+
+
+def append_result(f, result):
+    """Append one result as a JSON line and flush it, so finished games survive a crash"""
+    if orjson is not None:
+        f.write(orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode() + "\n")
+    else:
+        f.write(json.dumps(result) + "\n")
+    f.flush()
+
+
+async def _drive(configs, suite_name, results_log):
+    """Run all test games concurrently, at most MAX_CONCURRENT_TESTS at a time"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TESTS)
+    cooldown = SUITES[suite_name]["provider_cooldown"]
+    loop = asyncio.get_running_loop()
+    next_start_by_provider = {}
+
+    async def run_limited(config):
+        provider = config["provider"]
+        async with semaphore:
+            # Providers have independent rate limits, so only games on the same one are spaced out.
+            # The start is reserved once the slot is held, so a freed slot can't start two at once
+            now = loop.time()
+            start = max(now, next_start_by_provider.get(provider, now))
+            next_start_by_provider[provider] = start + cooldown
+            await asyncio.sleep(start - now)
+            result = await run_test(config, suite_name)
+        append_result(results_log, result)
+        return result
+
+    return await asyncio.gather(*(run_limited(config) for config in configs), return_exceptions=True)
+
+
+def print_ranking(results):
+    """Print successful tests ranked by performance, then failures; return the best result"""
+    print("\n\n" + "=" * 80)
+    print("📊 FINAL RESULTS SUMMARY")
+    print("=" * 80)
+
+    # Rank by performance (fewer invalid moves, faster time)
+    successful_tests = sorted((r for r in results if r["success"]), key=itemgetter("invalid_moves", "time"))
+    failed_tests = [r for r in results if not r["success"]]
+
+    best = None
+    if successful_tests:
+
+        print("\n🏆 SUCCESSFUL TESTS (ranked by performance):\n")
+        for i, result in enumerate(successful_tests, 1):
+            print(f"{i}. {result['name']}")
+            print(f"   Model: {result['model']}")
+            print(f"   Invalid moves: {result['invalid_moves']}")
+            print(f"   Time: {result['time']:.1f}s")
+            print(f"   Winner: {result['winner']}")
+            print(f"   Log: {result.get('log_path', 'N/A')}")
+            print()
+
+        # Recommend best config
+        best = successful_tests[0]
+        print("\n" + "🎯" * 40)
+        print(f"🏆 RECOMMENDED CONFIGURATION:")
+        print(f"   Name: {best['name']}")
+        print(f"   Model: {best['model']}")
+        print(f"   Provider: {best['provider']}")
+        print(f"   Invalid moves: {best['invalid_moves']}")
+        print(f"   Time: {best['time']:.1f}s")
+        print("🎯" * 40)
+
+    if failed_tests:
+        print("\n❌ FAILED TESTS:\n")
+        for result in failed_tests:
+            print(f"- {result['name']}: {result.get('error', 'Unknown')}")
+
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play one game per model and rank the models")
+    parser.add_argument("--configs", choices=sorted(SUITES), default="comprehensive",
+                        help="Which model list to test (default: comprehensive)")
+    parser.add_argument("--skip-model-check", action="store_true",
+                        help="Don't validate model names against the providers' model lists")
+    args = parser.parse_args(argv)
+
+    suite_name = args.configs
+    suite = SUITES[suite_name]
+    configs = suite["configs"]
+
+    print(suite["title"])
+    print("=" * 80)
+    print(f"Total models to test: {len(configs)}")
+
+    rejected = []
+    if not args.skip_model_check:
+        # The model listings need the API keys kept in .env
+        load_dotenv(dotenv_path='.env')
+        configs, rejected = validate_configs(configs)
+        for config in rejected:
+            print(f"❌ Skipping {config['name']}: {config['provider']} has no model '{config['model']}'")
+
+    print(f"Running up to {MAX_CONCURRENT_TESTS} games concurrently...")
+
+    with open(suite["results_file"], "a") as results_log:
+        outcomes = asyncio.run(_drive(configs, suite_name, results_log))
+        for config in rejected:
+            append_result(results_log, failed_result(config, "Unknown model", 0))
+
+    results = [failed_result(config, "Unknown model", 0) for config in rejected]
+    for i, (config, result) in enumerate(zip(configs, outcomes), 1):
+        if isinstance(result, BaseException):
+            result = failed_result(config, str(result), 0)
+        results.append(result)
+
+        # Print summary
+        print(f"\n📊 Test {i}/{len(configs)}: {result['name']}")
+        if result["success"]:
+            print(f"✅ Success!")
+            print(f"   Time: {result['time']:.1f}s")
+            print(f"   Invalid moves: {result['invalid_moves']}")
+            if result.get("errors"):
+                print(f"   Logged errors: {result['errors']}")
+            print(f"   Winner: {result['winner']}")
+            if result.get("game_info"):
+                print(f"   Game info: {result['game_info']}")
+        else:
+            print(f"❌ Failed: {result.get('error', 'Unknown error')}")
+            if "log_path" in result:
+                print(f"   Log: {result['log_path']}")
+
+    best = print_ranking(results)
+
+    if best and suite["write_best_config"]:
+        # Create final config
+        for config in configs:
+            if config["name"] == best["name"]:
+                create_config(config, suite_name, "config.yml", stop_after=SUBMISSION_STOP_AFTER)
+                print(f"\n✅ Final config.yml created with {best['name']}")
+                print("   Ready for submission!")
+                break
+
+    print(f"\n📁 Detailed results appended to: {suite['results_file']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -37,16 +37,27 @@ class ChessEnv(ta.Env):
         self._agument_observations()
         return self.state.step()
 
+    def step_move(self, move: chess.Move) -> Tuple[bool, ta.Info]:
+        """ Same as step() for an already parsed move: skips the action wrappers and the regex parse of the action string """
+        move_uci = move.uci()
+        self.state.add_observation(from_id=self.state.current_player_id, message=f"[{move_uci}]", observation_type=ta.ObservationType.PLAYER_ACTION)
+        self._play_move(move=move, move_uci=move_uci)
+        self._check_gameover()
+        self._agument_observations()
+        return self.state.step()
+
     def _execute_player_move(self, action: str):
         match = re.compile(r"\[[a-h][1-8][a-h][1-8][qrbn]?\]", re.IGNORECASE).search(action.strip())
         if match is None: self.state.set_invalid_move(reason=f"Wrong move format.") # check if a move was provided
         else:
             move_uci = match.group(0).lower().replace("[", "").replace("]", "") # Extract the move from within the brackets
-            move = chess.Move.from_uci(move_uci) # Attempt to make the move
-            if move in self.state.game_state["board"].legal_moves:
-                self.state.game_state["board"].push(move) # execute move
-                self.state.add_observation(message=f"Player {self.state.current_player_id} made the following move: {move_uci}", observation_type=ta.ObservationType.GAME_ACTION_DESCRIPTION)
-            else: self.state.set_invalid_move(reason=f"Illegal move.") # illegal move
+            self._play_move(move=chess.Move.from_uci(move_uci), move_uci=move_uci) # Attempt to make the move
+
+    def _play_move(self, move: chess.Move, move_uci: str):
+        if move in self.state.game_state["board"].legal_moves:
+            self.state.game_state["board"].push(move) # execute move
+            self.state.add_observation(message=f"Player {self.state.current_player_id} made the following move: {move_uci}", observation_type=ta.ObservationType.GAME_ACTION_DESCRIPTION)
+        else: self.state.set_invalid_move(reason=f"Illegal move.") # illegal move
 
     def _check_gameover(self):
         if self.state.game_state["board"].is_game_over():
@@ -16,6 +16,11 @@ class LLMObservationWrapper(ObservationWrapper):
         super().__init__(env)
         self.full_observations: Dict[int, List[Tuple[int, str]]] = {}
 
+    def reset(self, num_players: int, seed: Optional[int] = None):
+        # A reused environment must not carry the previous game's history into the next one
+        self.full_observations = {}
+        return self.env.reset(num_players=num_players, seed=seed)
+
     def _convert_obs_to_str(self, player_id: int) -> Observations:
         str_observation = ""
         
@@ -3,9 +3,30 @@ import json
 import shutil
 import re
 import chess
+from chess import PIECE_SYMBOLS, SQUARE_NAMES
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
+# A UCI move, optionally wrapped in brackets, e.g. "e2e4", "[e7e8q]"
+UCI_PATTERN = re.compile(r'\[?\s*([a-h][1-8][a-h][1-8][qrbn]?)\s*\]?')
+
+# (piece type, White symbol, Black symbol) in the order list_piece_positions reports them
+PIECE_ORDER = tuple(
+    (piece_type, PIECE_SYMBOLS[piece_type].upper(), PIECE_SYMBOLS[piece_type])
+    for piece_type in (chess.KING, chess.QUEEN, chess.ROOK, chess.BISHOP, chess.KNIGHT, chess.PAWN)
+)
+
+# Marks the observation lines that record a move, e.g. "[GAME] Player 0 made the following move: e2e4"
+MOVE_MARKER = "made the following move:"
+
+@lru_cache(maxsize=None)
+def _board_frame(inner_width: int):
+    """Border and file-letter lines around a board whose rows are inner_width wide"""
+    border = f"   +{'-' * (inner_width + 2)}+"
+    files = "   " + "a b c d e f g h".center(inner_width + 2)
+    return border, files
+
 class Utils:
 
     @staticmethod
@@ -17,8 +38,9 @@ class Utils:
     def save_json(obj, path, delete_prev_file=False):
         if os.path.exists(path) and delete_prev_file:
             os.remove(path)
+        # Compact output keeps json on its C encoder; indent= falls back to pure Python
         with open(path, "w") as f:
-            json.dump(obj, f, indent=4)
+            json.dump(obj, f, separators=(",", ":"))
     
     @staticmethod
     def read_file(path):
@@ -41,7 +63,11 @@ class Utils:
         return "".join(args)
 
     @staticmethod
-    def append_file(string, path):
+    def append_file(string, path, handle=None):
+        """Append a line to path, or to handle when the caller keeps the file open"""
+        if handle is not None:
+            handle.write(string+"\n")
+            return
         directory = os.path.dirname(path)
         os.makedirs(directory, exist_ok=True)
         with open(path, "a", encoding="utf-8") as f:
@@ -53,11 +79,10 @@ class Utils:
 
     @staticmethod
     def board_with_coords(board: chess.Board) -> str:
-        inner_width = len(str(board).splitlines()[0])
-        top = bottom = f"   +{'-' * (inner_width + 2)}+"
-        body = [f" {rank} | {row} |" for rank, row in zip(range(8, 0, -1), str(board).splitlines())]
-        files = "   " + " ".join("a b c d e f g h".split()).center(inner_width + 2)
-        return "\n".join([top, *body, bottom, files])
+        rows = str(board).splitlines()
+        border, files = _board_frame(len(rows[0]))
+        body = "\n".join(f" {rank} | {row} |" for rank, row in zip(range(8, 0, -1), rows))
+        return f"{border}\n{body}\n{border}\n{files}"
 
     @staticmethod
     def list_piece_positions(board: chess.Board) -> str:
@@ -71,24 +96,14 @@ class Utils:
         """
         white_pieces = []
         black_pieces = []
-        
-        # Iterate through all squares
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece:
-                square_name = chess.square_name(square)
-                piece_symbol = piece.symbol()
-                
-                if piece.color == chess.WHITE:
-                    white_pieces.append(f"{piece_symbol}-{square_name}")
-                else:
-                    black_pieces.append(f"{piece_symbol}-{square_name}")
-        
-        # Sort pieces by type (K, Q, R, B, N, P for white; k, q, r, b, n, p for black)
-        piece_order = {'K': 0, 'Q': 1, 'R': 2, 'B': 3, 'N': 4, 'P': 5, 
-                       'k': 0, 'q': 1, 'r': 2, 'b': 3, 'n': 4, 'p': 5}
-        white_pieces.sort(key=lambda x: piece_order.get(x[0], 6))
-        black_pieces.sort(key=lambda x: piece_order.get(x[0], 6))
+
+        # Walk each piece type's bitboard, K, Q, R, B, N, P, so pieces come out already
+        # grouped by type and only occupied squares are visited
+        for piece_type, white_symbol, black_symbol in PIECE_ORDER:
+            for square in chess.scan_forward(board.pieces_mask(piece_type, chess.WHITE)):
+                white_pieces.append(f"{white_symbol}-{SQUARE_NAMES[square]}")
+            for square in chess.scan_forward(board.pieces_mask(piece_type, chess.BLACK)):
+                black_pieces.append(f"{black_symbol}-{SQUARE_NAMES[square]}")
         
         white_str = "White pieces: " + ", ".join(white_pieces) if white_pieces else "White pieces: none"
         black_str = "Black pieces: " + ", ".join(black_pieces) if black_pieces else "Black pieces: none"
@@ -100,14 +115,15 @@ class Utils:
         """
         Return the last valid chess action from the action string.
         """
-        UCI_PATTERN = re.compile(r'\[?\s*([a-h][1-8][a-h][1-8][qrbn]?)\s*\]?')
         if action is None:
             return None
         
-        # Find all matches and take the last one
-        matches = UCI_PATTERN.findall(action)
-        if matches:
-            return f'[{matches[-1]}]'
+        # Walk the matches keeping only the last one, without building a list of them all
+        match = None
+        for match in UCI_PATTERN.finditer(action):
+            pass
+        if match:
+            return f'[{match.group(1)}]'
         
         return None
 
@@ -126,39 +142,38 @@ class Utils:
                 - truncated_observation: String with up to the last truncate_steps moves
                 - formatted_moves_string: Formatted string with player labels (e.g., "White: [e2e4]\nBlack: [e7e5]")
         """
-        lines = observation.split('\n')
-        
-        # Find all move lines (lines that contain "made the following move:")
-        move_indices = []
+        # One pass over the raw string: find each move line and note where it starts,
+        # instead of splitting into lines and scanning them twice
+        move_starts = []
         actions = []
         
-        for i, line in enumerate(lines):
-            if "made the following move:" in line:
-                move_indices.append(i)
-                # Extract the move (last word in the line)
-                move = line.strip().split()[-1]
-                actions.append(move)
+        pos = observation.find(MOVE_MARKER)
+        while pos != -1:
+            line_start = observation.rfind('\n', 0, pos) + 1
+            line_end = observation.find('\n', pos)
+            if line_end == -1:
+                line_end = len(observation)
+            move_starts.append(line_start)
+            # Extract the move (last word in the line)
+            actions.append(observation[line_start:line_end].split()[-1])
+            pos = observation.find(MOVE_MARKER, line_end)
         
         # Determine how many moves to keep (min of truncate_steps and actual moves)
-        num_moves_to_keep = min(truncate_steps, len(move_indices))
+        total_moves_made = len(move_starts)
+        num_moves_to_keep = min(truncate_steps, total_moves_made)
         
         if num_moves_to_keep == 0:
             # No moves yet, return the full observation
             return observation, "[]"
         
-        # Find the starting index for truncation
-        start_move_idx = move_indices[-num_moves_to_keep]
-        
-        # Keep the game header and everything from the start_move_idx onwards
-        truncated_lines = lines[:1] + lines[start_move_idx:]
+        # Keep the game header line and everything from the first kept move onwards
+        header_end = observation.find('\n')
+        header = observation if header_end == -1 else observation[:header_end]
+        truncated_observation = header + '\n' + observation[move_starts[-num_moves_to_keep]:]
         actions = actions[-num_moves_to_keep:]
         
-        truncated_observation = '\n'.join(truncated_lines)
-        
         # Format moves with player labels
         # Need to figure out which player made the first move in our truncated list
-        # Total moves made = len(all actions), last num_moves_to_keep = actions list
-        total_moves_made = len([l for l in lines if "made the following move:" in l])
         first_move_index = total_moves_made - num_moves_to_keep
         
         formatted_moves = []